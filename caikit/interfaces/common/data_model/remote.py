@@ -129,7 +129,9 @@ class ConnectionInfo(DataObjectBase):
     """DataClass to store information regarding an external connection. This includes the hostname,
     port, tls, and timeout settings"""
 
-    # Generic Host settings
+    # Generic Host settings. For grpc the hostname can also be a unix socket
+    # target (e.g. unix:///tmp/grpc.sock or unix-abstract:grpc) in which case
+    # the port is not used
     hostname: str
     port: Optional[int] = None
 
@@ -58,6 +58,8 @@ from caikit.runtime.client.remote_config import RemoteModuleConfig
 from caikit.runtime.client.utils import (
     construct_grpc_channel,
     construct_requests_session,
+    get_grpc_target,
+    is_unix_socket_target,
 )
 from caikit.runtime.names import (
     MODEL_MESH_MODEL_ID_KEY,
@@ -126,6 +128,14 @@ class RemoteModelFinder(ModelFinderBase):
                     "GRPC does not support insecure TLS connections."
                     "Please provide a valid CA certificate",
                 )
+        else:
+            for conn in self._connections.values():
+                error.value_check(
+                    "<COR74451568E>",
+                    not is_unix_socket_target(conn),
+                    "Unix socket targets are only supported with GRPC: {}",
+                    conn.hostname,
+                )
 
         # Initialize the supported models using the model connection info
         self._supported_models: Dict[str, ModuleConnectionInfo] = {}
@@ -254,7 +264,7 @@ class RemoteModelFinder(ModelFinderBase):
         """
         supported_modules = {}
         for conn in self._get_conn_candidates(model_name):
-            target = f"{conn.hostname}:{conn.port}"
+            target = get_grpc_target(conn)
             options = [tuple(opt) for opt in conn.options.items()]
             with construct_grpc_channel(
                 target, options, conn.tls, conn.retries, conn.retry_options
@@ -23,6 +23,7 @@ model_management:
             type: REMOTE
 """
 # Standard
+from threading import Lock
 from typing import Optional, Type
 
 # First Party
@@ -49,6 +50,7 @@ class RemoteModelInitializer(ModelInitializerBase):
         """Construct with the config"""
         self._instance_name = instance_name
         self._module_class_map = {}
+        self._module_class_lock = Lock()
 
     def init(self, model_config: RemoteModuleConfig, **kwargs) -> Optional[ModuleBase]:
         """Given a RemoteModuleConfig, initialize a RemoteModule instance"""
@@ -60,13 +62,18 @@ class RemoteModelInitializer(ModelInitializerBase):
             )
             return
 
-        # Construct remote module class if one has not already been created
-        self._module_class_map.setdefault(
-            model_config.module_id,
-            self.construct_module_class(model_config=model_config),
-        )
+        # Models are loaded concurrently and constructing a second class for the
+        # same module_id raises a conflict, so the class map is only accessed
+        # under the lock
+        with self._module_class_lock:
+            # Construct remote module class if one has not already been created
+            if model_config.module_id not in self._module_class_map:
+                self._module_class_map[
+                    model_config.module_id
+                ] = self.construct_module_class(model_config=model_config)
+
+            remote_module_class = self._module_class_map[model_config.module_id]
 
-        remote_module_class = self._module_class_map[model_config.module_id]
         return remote_module_class(
             model_config.connection,
             model_config.protocol,
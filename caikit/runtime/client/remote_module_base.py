@@ -43,6 +43,8 @@ from caikit.runtime.client.remote_config import RemoteModuleConfig, RemoteRPCDes
 from caikit.runtime.client.utils import (
     construct_grpc_channel,
     construct_requests_session,
+    get_grpc_target,
+    is_unix_socket_target,
 )
 from caikit.runtime.names import (
     HTTP_TO_STATUS_CODE,
@@ -96,6 +98,13 @@ class RemoteModuleBase(ModuleBase):
                 "GRPC does not support insecure TLS connections."
                 "Please provide a valid CA certificate",
             )
+        if self._protocol == "http":
+            error.value_check(
+                "<COR74451568E>",
+                not is_unix_socket_target(self._connection),
+                "Unix socket targets are only supported with GRPC: {}",
+                self._connection.hostname,
+            )
 
     def __del__(self):
         """Destructor to ensure channel/session is cleaned up on deletion"""
@@ -494,10 +503,10 @@ class RemoteModuleBase(ModuleBase):
 
     def _get_remote_target(self) -> str:
         """Get the current remote target"""
-        target_string = f"{self._connection.hostname}:{self._connection.port}"
         if self._protocol == "grpc":
-            return target_string
+            return get_grpc_target(self._connection)
         else:
+            target_string = f"{self._connection.hostname}:{self._connection.port}"
             if self._tls.enabled:
                 return f"https://{target_string}"
             else:
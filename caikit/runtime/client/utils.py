@@ -26,7 +26,39 @@ from requests.adapters import HTTPAdapter, Retry
 import grpc
 
 # Local
-from caikit.interfaces.common.data_model import ConnectionTlsInfo
+from caikit.interfaces.common.data_model import ConnectionInfo, ConnectionTlsInfo
+
+# Target schemes for grpc unix sockets. These targets already identify the
+# socket so no port is added
+# CITE: https://github.com/grpc/grpc/blob/master/doc/naming.md
+GRPC_UNIX_SOCKET_SCHEMES = ("unix:", "unix-abstract:")
+
+
+def is_unix_socket_target(connection: ConnectionInfo) -> bool:
+    """Helper function to check if a connection's hostname is a grpc unix socket
+    target
+
+    Args:
+        connection (ConnectionInfo): The connection to check
+
+    Returns:
+        bool: True if the hostname uses one of the GRPC_UNIX_SOCKET_SCHEMES
+    """
+    return connection.hostname.startswith(GRPC_UNIX_SOCKET_SCHEMES)
+
+
+def get_grpc_target(connection: ConnectionInfo) -> str:
+    """Helper function to get the grpc target for a connection
+
+    Args:
+        connection (ConnectionInfo): The connection to get the target for
+
+    Returns:
+        str: The unix socket target if the hostname is one, otherwise hostname:port
+    """
+    if is_unix_socket_target(connection):
+        return connection.hostname
+    return f"{connection.hostname}:{connection.port}"
 
 
 def construct_grpc_channel(
@@ -51,6 +83,9 @@ def construct_grpc_channel(
     Returns:
         grpc.Channel: The constructed channel
     """
+    # Copy the options so the caller's list is not modified
+    options = list(options or [])
+
     # Add retry option if one was provided
     if retries and retries > 1:
         options.append(("grpc.enable_retries", 1))
@@ -154,7 +189,7 @@ def construct_requests_session(
             total=retries,
             allowed_methods=None,
             status_forcelist=default_status_codes,
-            **(retry_options or {})
+            **(retry_options or {}),
         )
         session.mount("http://", HTTPAdapter(max_retries=requests_retry))
         session.mount("https://", HTTPAdapter(max_retries=requests_retry))
@@ -19,6 +19,8 @@ Tests for the RemoteModelFinder
 from contextlib import contextmanager
 from typing import Optional
 from unittest.mock import MagicMock, patch
+import os
+import tempfile
 
 # Third Party
 import grpc
@@ -33,14 +35,15 @@ from caikit.runtime.client import RemoteModelFinder, RemoteModuleConfig
 from caikit.runtime.model_management.model_manager import ModelManager
 from sample_lib.modules.file_processing import BoundingBoxModule
 from sample_lib.modules.sample_task import SampleModule
-from tests.conftest import random_test_id
+from tests.conftest import random_test_id, temp_config
 from tests.fixtures import Fixtures
 from tests.runtime.conftest import multi_task_model_id  # noqa: F401
 from tests.runtime.conftest import sample_task_model_id  # noqa: F401
 from tests.runtime.conftest import (  # noqa: F401
-    generate_tls_configs,
+    get_open_port,
     open_port,
     runtime_test_server,
+    runtime_tls_test_server,
 )
 
 ## Test Helpers #######################################################################
@@ -293,81 +296,69 @@ def test_remote_finder_discover_multi_conn_models(protocol):
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
 def test_remote_finder_discover_mtls_models(sample_task_model_id, open_port, protocol):
     """Test to ensure discovering models works for https with MTLS and secure CA"""
-    with generate_tls_configs(
-        open_port, tls=True, mtls=True
-    ) as config_overrides:  # noqa: SIM117
-        with runtime_test_server(
-            open_port,
-            protocol=protocol,
-            tls_config_override=config_overrides if protocol == "http" else None,
-        ) as server_with_tls, temp_finder(
-            connection_cfg={
-                "hostname": "localhost",
-                "port": server_with_tls.port,
-                "tls": {
-                    "enabled": True,
-                    "ca_file": config_overrides["use_in_test"]["ca_cert"],
-                    "cert_file": config_overrides["use_in_test"]["client_cert"],
-                    "key_file": config_overrides["use_in_test"]["client_key"],
-                },
+    with runtime_tls_test_server(open_port, protocol=protocol, mtls=True) as (
+        config_overrides,
+        server_with_tls,
+    ), temp_finder(
+        connection_cfg={
+            "hostname": "localhost",
+            "port": server_with_tls.port,
+            "tls": {
+                "enabled": True,
+                "ca_file": config_overrides["use_in_test"]["ca_cert"],
+                "cert_file": config_overrides["use_in_test"]["client_cert"],
+                "key_file": config_overrides["use_in_test"]["client_key"],
             },
-            protocol=protocol,
-        ) as finder:
-            config = finder.find_model(sample_task_model_id)
-            assert isinstance(config, RemoteModuleConfig)
-            assert sample_task_model_id == config.model_path
-            assert len(config.task_methods) == 1
-            # Assert how many SampleTask methods there are
-            assert len(config.task_methods[0][1]) == 4
+        },
+        protocol=protocol,
+    ) as finder:
+        config = finder.find_model(sample_task_model_id)
+        assert isinstance(config, RemoteModuleConfig)
+        assert sample_task_model_id == config.model_path
+        assert len(config.task_methods) == 1
+        # Assert how many SampleTask methods there are
+        assert len(config.task_methods[0][1]) == 4
 
 
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
 def test_remote_finder_fail_ca_check(sample_task_model_id, open_port, protocol):
     """Test to ensure discovering models fails when the client doesn't trust the CA"""
-    with generate_tls_configs(
-        open_port, tls=True, mtls=False
-    ) as config_overrides:  # noqa: SIM117
-        with runtime_test_server(
-            open_port,
-            protocol=protocol,
-            tls_config_override=config_overrides if protocol == "http" else None,
-        ) as server_with_tls, temp_finder(
-            connection_cfg={
-                "hostname": "localhost",
-                "port": server_with_tls.port,
-                "tls": {
-                    "enabled": True,
-                    "insecure_verify": False,
-                },
+    with runtime_tls_test_server(open_port, protocol=protocol, mtls=False) as (
+        _,
+        server_with_tls,
+    ), temp_finder(
+        connection_cfg={
+            "hostname": "localhost",
+            "port": server_with_tls.port,
+            "tls": {
+                "enabled": True,
+                "insecure_verify": False,
             },
-            protocol=protocol,
-        ) as finder:
-            assert not finder.find_model(sample_task_model_id)
+        },
+        protocol=protocol,
+    ) as finder:
+        assert not finder.find_model(sample_task_model_id)
 
 
 def test_remote_finder_discover_https_insecure_models(sample_task_model_id, open_port):
     """Test to ensure discovering models works for https without checking certs"""
-    with generate_tls_configs(
-        open_port, tls=True, mtls=False
-    ) as config_overrides:  # noqa: SIM117
-        with runtime_test_server(
-            open_port,
-            protocol="http",
-            tls_config_override=config_overrides,
-        ) as server_with_tls, temp_finder(
-            connection_cfg={
-                "hostname": "localhost",
-                "port": server_with_tls.port,
-                "tls": {"enabled": True, "insecure_verify": True},
-            },
-            protocol="http",
-        ) as finder:
-            config = finder.find_model(sample_task_model_id)
-            assert isinstance(config, RemoteModuleConfig)
-            assert sample_task_model_id == config.model_path
-            assert len(config.task_methods) == 1
-            # Assert how many SampleTask methods there are
-            assert len(config.task_methods[0][1]) == 4
+    with runtime_tls_test_server(open_port, protocol="http", mtls=False) as (
+        _,
+        server_with_tls,
+    ), temp_finder(
+        connection_cfg={
+            "hostname": "localhost",
+            "port": server_with_tls.port,
+            "tls": {"enabled": True, "insecure_verify": True},
+        },
+        protocol="http",
+    ) as finder:
+        config = finder.find_model(sample_task_model_id)
+        assert isinstance(config, RemoteModuleConfig)
+        assert sample_task_model_id == config.model_path
+        assert len(config.task_methods) == 1
+        # Assert how many SampleTask methods there are
+        assert len(config.task_methods[0][1]) == 4
 
 
 def test_remote_finder_discover_grpc_insecure_models():
@@ -388,6 +379,35 @@ def test_remote_finder_discover_grpc_insecure_models():
         )
 
 
+def test_remote_finder_discover_unix_socket_models(sample_task_model_id):
+    """Test to ensure discovering models works for a grpc unix socket target"""
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "grpc.sock")
+        with temp_config(
+            {"runtime": {"grpc": {"unix_socket_path": socket_path}}}, "merge"
+        ), runtime_test_server(get_open_port(), protocol="grpc"), temp_finder(
+            connection_cfg={"hostname": f"unix://{socket_path}"},
+        ) as finder:
+            config = finder.find_model(sample_task_model_id)
+            assert isinstance(config, RemoteModuleConfig)
+            assert config.connection.hostname == f"unix://{socket_path}"
+
+
+def test_remote_finder_http_unix_socket():
+    """Test to ensure the finder raises an error when using a unix socket target
+    with http"""
+    with pytest.raises(ValueError):
+        RemoteModelFinder(
+            Config(
+                {
+                    "connection": {"hostname": "unix:///tmp/grpc.sock"},
+                    "protocol": "http",
+                }
+            ),
+            "remote_finder",
+        )
+
+
 def test_remote_finder_not_found():
     """Test to ensure error is raised when no model is found"""
     with temp_finder(  # noqa: SIM117
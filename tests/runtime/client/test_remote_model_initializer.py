@@ -16,8 +16,13 @@ Tests for the RemoteModelInitializer
 """
 
 # Standard
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest import mock
+import copy
+import itertools
+import os
+import time
 
 # Third Party
 import pytest
@@ -27,94 +32,210 @@ from aconfig import Config
 
 # Local
 from caikit.core.data_model.streams.data_stream import DataStream
-from caikit.core.modules import ModuleBase
+from caikit.core.modules import ModuleBase, ModuleConfig
+from caikit.core.registries import module_registry
 from caikit.interfaces.common.data_model.remote import ConnectionInfo, ConnectionTlsInfo
 from caikit.runtime.client import RemoteModelInitializer, RemoteModuleConfig
-from caikit.runtime.model_management.model_manager import ModelManager
 from caikit.runtime.names import MODEL_MESH_MODEL_ID_KEY
 from caikit.runtime.types.caikit_runtime_exception import CaikitRuntimeException
 from sample_lib.data_model import SampleInputType, SampleOutputType, SampleTrainingType
-from tests.conftest import random_test_id
+from tests.conftest import FIXTURES_DIR, random_test_id
 from tests.fixtures import Fixtures  # noqa: F401
 from tests.runtime.conftest import multi_task_model_id  # noqa: F401
-from tests.runtime.conftest import open_port  # noqa: F401
 from tests.runtime.conftest import sample_task_model_id  # noqa: F401
-from tests.runtime.conftest import generate_tls_configs, runtime_test_server
+from tests.runtime.conftest import shared_runtime_server  # noqa: F401
+from tests.runtime.conftest import shared_runtime_servers  # noqa: F401
+from tests.runtime.conftest import get_open_port, runtime_tls_test_server
 import caikit
 
-## Tests #######################################################################
+# Keep all tests in this module on one xdist worker so they share the module
+# scoped servers
+pytestmark = pytest.mark.xdist_group("remote_initializer")
 
+# Module ids only need to be unique within this process
+_MODULE_ID_SEQ = itertools.count()
 
-@pytest.mark.parametrize("protocol", ["grpc", "http"])
-def test_remote_initializer_insecure_predict(sample_task_model_id, open_port, protocol):
-    """Test to ensure RemoteModule Initializer works for insecure connections"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
+## Fixtures ####################################################################
 
-    # Construct Remote Module Config
-    connection_info = ConnectionInfo(hostname="localhost", port=open_port)
-    remote_config = RemoteModuleConfig.load_from_module(
+
+@pytest.fixture(scope="session")
+def local_module_class():
+    """The local module class of the model loaded by sample_task_model_id. This
+    is looked up from the fixture model's own config so it doesn't need a model
+    to be loaded by the ModelManager"""
+    model_config = ModuleConfig.load(os.path.join(FIXTURES_DIR, "models", "foo"))
+    return module_registry()[model_config.module_id]
+
+
+@pytest.fixture(scope="module")
+def base_remote_config(local_module_class):
+    """RemoteModuleConfig for the local module. Building the config parses all of
+    the module's method signatures, so it's only done once and tests copy it
+    with make_remote_config"""
+    return RemoteModuleConfig.load_from_module(
         local_module_class,
-        connection_info,
-        protocol,
+        ConnectionInfo(hostname="localhost"),
+        "grpc",
         MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+        "",
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
 
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct initializer and RemoteModule
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
 
-        # Run RemoteModule Request
-        model_result = remote_model.run(SampleInputType(name="Test"), throw=False)
-        assert isinstance(model_result, SampleOutputType)
-        assert model_result.greeting == "Hello Test"
+@pytest.fixture(scope="module")
+def sample_input():
+    """Input shared by all of the unary requests"""
+    return SampleInputType(name="Test")
+
+
+@pytest.fixture(scope="module")
+def sample_stream_inputs():
+    """Inputs shared by all of the input streaming requests"""
+    return [
+        SampleInputType(name="Test1"),
+        SampleInputType(name="Test2"),
+        SampleInputType(name="Test3"),
+    ]
+
+
+@pytest.fixture(scope="module")
+def remote_initializer():
+    """Remote initializer shared between all tests in this module"""
+    return RemoteModelInitializer(Config({}), "test")
+
+
+@pytest.fixture
+def remote_connection(request, protocol):
+    """Set up a runtime server for the requested TLS mode and yield the
+    ConnectionInfo to reach it along with the exception expected when
+    initializing the RemoteModule, if any"""
+    tls_mode = request.param
+
+    # Insecure connections can use the server shared with the other tests. GRPC
+    # goes through its unix socket since the other tests already cover TCP
+    if tls_mode == "insecure":
+        server = request.getfixturevalue("shared_runtime_server")
+        if protocol == "grpc":
+            yield ConnectionInfo(hostname=server.unix_socket_target), None
+        else:
+            yield ConnectionInfo(hostname="localhost", port=server.port), None
+        return
+
+    # GRPC does not support unverified TLS so the error is raised before any
+    # request is sent and no server is needed
+    if tls_mode == "tls_unverified" and protocol == "grpc":
+        connection_info = ConnectionInfo(
+            hostname="localhost",
+            port=get_open_port(),
+            tls=ConnectionTlsInfo(enabled=True, insecure_verify=True),
+        )
+        yield connection_info, ValueError
+        return
+
+    port = get_open_port()
+    mtls = tls_mode == "mtls"
+    with runtime_tls_test_server(port, protocol=protocol, mtls=mtls) as (
+        config_overrides,
+        _,
+    ):
+        if mtls:
+            tls_info = ConnectionTlsInfo(
+                enabled=True,
+                ca_file=config_overrides["use_in_test"]["ca_cert"],
+                cert_file=config_overrides["use_in_test"]["client_cert"],
+                key_file=config_overrides["use_in_test"]["client_key"],
+            )
+        else:
+            tls_info = ConnectionTlsInfo(enabled=True, insecure_verify=True)
+        yield ConnectionInfo(hostname="localhost", port=port, tls=tls_info), None
+
+
+## Helpers #####################################################################
+
+
+def make_remote_config(
+    base_remote_config: RemoteModuleConfig,
+    connection_info: ConnectionInfo,
+    protocol: str,
+    model_path: str,
+) -> RemoteModuleConfig:
+    """Copy the base config and point it at the given remote model"""
+    remote_config = copy.copy(base_remote_config)
+    remote_config.connection = connection_info
+    remote_config.protocol = protocol
+    remote_config.model_path = model_path
+    # Set unique module_id so tests don't conflict
+    remote_config.module_id = f"test-remote-{next(_MODULE_ID_SEQ)}"
+    return remote_config
+
+
+## Tests #######################################################################
+
+
+@pytest.mark.parametrize("protocol", ["grpc", "http"])
+@pytest.mark.parametrize(
+    "remote_connection", ["insecure", "mtls", "tls_unverified"], indirect=True
+)
+def test_remote_initializer_predict(
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    remote_connection,
+    protocol,
+    sample_input,
+):
+    """Test to ensure RemoteModule Initializer works for insecure, TLS and MTLS
+    connections and raises when unverified TLS is used with GRPC"""
+    connection_info, expected_error = remote_connection
+    # Construct Remote Module Config
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
+    )
+
+    if expected_error:
+        with pytest.raises(expected_error):
+            remote_initializer.init(remote_config)
+        return
+
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
+
+    # Run RemoteModule Request
+    model_result = remote_model.run(sample_input)
+    assert isinstance(model_result, SampleOutputType)
+    assert model_result.greeting == "Hello Test"
 
 
 # Input streaming is only supported on grpc
 @pytest.mark.parametrize("protocol", ["grpc"])
-def test_remote_initializer_input_streaming(sample_task_model_id, open_port, protocol):
+def test_remote_initializer_input_streaming(
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_stream_inputs,
+):
     """Test to ensure Remote Initializer works with input streaming"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
-
     # Construct Remote Module Config
-    connection_info = ConnectionInfo(hostname="localhost", port=open_port)
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    connection_info = ConnectionInfo(
+        hostname="localhost", port=shared_runtime_server.port
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
-
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct remote initializer and RemoteModule class
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
-
-        # Construct input data stream
-        stream_input = DataStream.from_iterable(
-            [
-                SampleInputType(name="Test1"),
-                SampleInputType(name="Test2"),
-                SampleInputType(name="Test3"),
-            ]
-        )
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
+    )
+
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
+
+    # Construct input data stream
+    stream_input = DataStream.from_iterable(sample_stream_inputs)
 
-        # Run inference and assert results
-        model_result = remote_model.run_stream_in(stream_input, greeting="Hello Tests ")
-        assert isinstance(model_result, SampleOutputType)
-        assert model_result.greeting == "Hello Tests Test1,Test2,Test3"
+    # Run inference and assert results
+    model_result = remote_model.run_stream_in(stream_input, greeting="Hello Tests ")
+    assert isinstance(model_result, SampleOutputType)
+    assert model_result.greeting == "Hello Tests Test1,Test2,Test3"
 
 
 @pytest.mark.parametrize(
@@ -125,38 +246,34 @@ def test_remote_initializer_input_streaming(sample_task_model_id, open_port, pro
         # "http"
     ],
 )
-def test_remote_initializer_output_streaming(sample_task_model_id, open_port, protocol):
+def test_remote_initializer_output_streaming(
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_input,
+):
     """Test to ensure Remote Initializer works when streaming outputs"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
     # Construct Remote Module Config
-    connection_info = ConnectionInfo(hostname="localhost", port=open_port)
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    connection_info = ConnectionInfo(
+        hostname="localhost", port=shared_runtime_server.port
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
-
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct remote initializer and RemoteModule class
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
-
-        # Run output streaming inference and assert all results work as expected
-        model_result = remote_model.run_stream_out(
-            SampleInputType(name="Test"), err_stream=False
-        )
-        assert isinstance(model_result, DataStream)
-        stream_results = [item for item in model_result]
-        assert len(stream_results) == 10
-        for item in stream_results:
-            assert item.greeting == "Hello Test stream"
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
+    )
+
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
+
+    # Run output streaming inference and assert all results work as expected
+    model_result = remote_model.run_stream_out(sample_input, err_stream=False)
+    assert isinstance(model_result, DataStream)
+    stream_results = list(model_result)
+    assert len(stream_results) == 10
+    for item in stream_results:
+        assert item.greeting == "Hello Test stream"
 
 
 @pytest.mark.parametrize(
@@ -168,322 +285,190 @@ def test_remote_initializer_output_streaming(sample_task_model_id, open_port, pr
     ],
 )
 def test_remote_initializer_streaming_deleted_model(
-    sample_task_model_id, open_port, protocol
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_input,
 ):
     """Test to ensure Remote Initializer is still able to stream outputs after the RemoteModelBase
     has been deleted or moved out of scope"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
     # Construct Remote Module Config
-    connection_info = ConnectionInfo(hostname="localhost", port=open_port)
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    connection_info = ConnectionInfo(
+        hostname="localhost", port=shared_runtime_server.port
+    )
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
-
-    with runtime_test_server(open_port, protocol=protocol):
-        # Initialize Remote Initializer and RemoteModuleBase
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
-
-        # Run output stream
-        model_result = remote_model.run_stream_out(
-            SampleInputType(name="Test"), err_stream=False
-        )
-        assert isinstance(model_result, DataStream)
 
-        # Get channel ref if in grpc
-        _channel_ref = None
-        if protocol == "grpc":
-            _channel_ref = remote_model._grpc_channel
+    # Initialize RemoteModuleBase
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-        # Delete Model Object
-        del remote_model
+    # Run output stream
+    model_result = remote_model.run_stream_out(sample_input, err_stream=False)
+    assert isinstance(model_result, DataStream)
 
-        # Assert stream can still be read
-        stream_results = [item for item in model_result]
-        assert len(stream_results) == 10
-        for item in stream_results:
-            assert item.greeting == "Hello Test stream"
+    # Get channel ref if in grpc
+    _channel_ref = None
+    if protocol == "grpc":
+        _channel_ref = remote_model._grpc_channel
 
-        # Delete ref to Data Stream
-        del model_result
+    # Delete Model Object
+    del remote_model
 
-        # Assert grpc channel has been closed
-        if protocol == "grpc":
-            with pytest.raises(ValueError) as exp:
-                _channel_ref._channel.check_connectivity_state(False)
-            assert "Channel closed!" in str(exp)
+    # Assert stream can still be read
+    stream_results = list(model_result)
+    assert len(stream_results) == 10
+    for item in stream_results:
+        assert item.greeting == "Hello Test stream"
+
+    # Delete ref to Data Stream
+    del model_result
+
+    # Assert grpc channel has been closed
+    if protocol == "grpc":
+        with pytest.raises(ValueError) as exp:
+            _channel_ref._channel.check_connectivity_state(False)
+        assert "Channel closed!" in str(exp)
 
 
 # Only GRPC Supports bidi streams
 @pytest.mark.parametrize("protocol", ["grpc"])
 def test_remote_initializer_input_output_streaming(
-    sample_task_model_id, open_port, protocol
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_stream_inputs,
 ):
     """Test to ensure Remote Initializer works when streaming outputs"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
     # Construct Remote Module Config
-    connection_info = ConnectionInfo(hostname="localhost", port=open_port)
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    connection_info = ConnectionInfo(
+        hostname="localhost", port=shared_runtime_server.port
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
-
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct Remote Initializer and RemoteModuleBase
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
-
-        # Construct input stream
-        stream_input = DataStream.from_iterable(
-            [
-                SampleInputType(name="Test1"),
-                SampleInputType(name="Test2"),
-                SampleInputType(name="Test3"),
-            ]
-        )
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
+    )
+
+    # Construct RemoteModuleBase
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-        # Send inference request
-        model_result = remote_model.run_bidi_stream(stream_input)
+    # Construct input stream
+    stream_input = DataStream.from_iterable(sample_stream_inputs)
 
-        # Assert output stream can be read
-        assert isinstance(model_result, DataStream)
-        stream_results = [item.greeting for item in model_result]
-        assert len(stream_results) == 3
-        assert stream_results == [
-            "Hello Test1",
-            "Hello Test2",
-            "Hello Test3",
-        ]
+    # Send inference request
+    model_result = remote_model.run_bidi_stream(stream_input)
+
+    # Assert output stream can be read
+    assert isinstance(model_result, DataStream)
+    stream_results = [item.greeting for item in model_result]
+    assert len(stream_results) == 3
+    assert stream_results == [
+        "Hello Test1",
+        "Hello Test2",
+        "Hello Test3",
+    ]
 
 
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
-def test_remote_initializer_train(sample_task_model_id, open_port, protocol):
+def test_remote_initializer_train(
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+):
     """Test to ensure Remote Initializer works when training with streaming inputs"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
     # Construct Remote Module Config
-    connection_info = ConnectionInfo(hostname="localhost", port=open_port)
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    connection_info = ConnectionInfo(
+        hostname="localhost", port=shared_runtime_server.port
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
-
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct Remote Initializer and RemoteModuleBase
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
-
-        # Construct Train request with stream types
-        stream_type = (
-            caikit.interfaces.common.data_model.DataStreamSourceSampleTrainingType
-        )
-        training_data = stream_type(
-            data_stream=stream_type.JsonData(
-                data=[SampleTrainingType(1), SampleTrainingType(2)]
-            )
-        )
-
-        # Train module
-        model_result = remote_model.train(
-            training_data=training_data, union_list=["str", "sequence"]
-        )
-        assert isinstance(model_result, ModuleBase)
-
-
-@pytest.mark.parametrize("protocol", ["grpc", "http"])
-def test_remote_initializer_mtls_predict(sample_task_model_id, open_port, protocol):
-    """Test to ensure Remote Initializer works with TLS and MTLS"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
     )
 
-    with generate_tls_configs(open_port, tls=True, mtls=True) as config_overrides:
-        # Construct Remote Module Config with TLS
-        connection_info = ConnectionInfo(
-            hostname="localhost",
-            port=open_port,
-            tls=ConnectionTlsInfo(
-                enabled=True,
-                ca_file=config_overrides["use_in_test"]["ca_cert"],
-                cert_file=config_overrides["use_in_test"]["client_cert"],
-                key_file=config_overrides["use_in_test"]["client_key"],
-            ),
-        )
-        remote_config = RemoteModuleConfig.load_from_module(
-            local_module_class,
-            connection_info,
-            protocol,
-            MODEL_MESH_MODEL_ID_KEY,
-            sample_task_model_id,
-        )
-        # Set random module_id so tests don't conflict
-        remote_config.module_id = random_test_id()
-
-        with runtime_test_server(
-            open_port,
-            protocol=protocol,
-            tls_config_override=config_overrides if protocol == "http" else None,
-        ):
-            # Construct Remote Initializer and RemoteModuleBase
-            remote_initializer = RemoteModelInitializer(Config({}), "test")
-            remote_model = remote_initializer.init(remote_config)
-            assert isinstance(remote_model, ModuleBase)
-
-            # Run inference and assert response is correct
-            model_result = remote_model.run(SampleInputType(name="Test"))
-            assert isinstance(model_result, SampleOutputType)
-            assert model_result.greeting == "Hello Test"
-
-
-def test_remote_initializer_https_unverified_predict(sample_task_model_id, open_port):
-    """Test to ensure RemoteModuleInitializer works with an unverified connection over HTTPS"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
+    # Construct RemoteModuleBase
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-    with generate_tls_configs(open_port, tls=True, mtls=False) as config_overrides:
-        # Construct Remote Module Config
-        connection_info = ConnectionInfo(
-            hostname="localhost",
-            port=open_port,
-            tls=ConnectionTlsInfo(enabled=True, insecure_verify=True),
+    # Construct Train request with stream types
+    stream_type = caikit.interfaces.common.data_model.DataStreamSourceSampleTrainingType
+    training_data = stream_type(
+        data_stream=stream_type.JsonData(
+            data=[SampleTrainingType(1), SampleTrainingType(2)]
         )
-        remote_config = RemoteModuleConfig.load_from_module(
-            local_module_class,
-            connection_info,
-            "http",
-            MODEL_MESH_MODEL_ID_KEY,
-            sample_task_model_id,
-        )
-        # Set random module_id so tests don't conflict
-        remote_config.module_id = random_test_id()
-
-        with runtime_test_server(
-            open_port,
-            protocol="http",
-            tls_config_override=config_overrides,
-        ):
-            # Construct Remote Initializer and RemoteModuleBase
-            remote_initializer = RemoteModelInitializer(Config({}), "test")
-            remote_model = remote_initializer.init(remote_config)
-            assert isinstance(remote_model, ModuleBase)
-
-            # Assert running inference works as expected
-            model_result = remote_model.run(SampleInputType(name="Test"))
-            assert isinstance(model_result, SampleOutputType)
-            assert model_result.greeting == "Hello Test"
-
-
-def test_remote_initializer_grpc_unverified_predict(sample_task_model_id, open_port):
-    """Test to ensure RemoteModuleInitializer raises an error when unverified GRPC is enabled"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
     )
 
-    with generate_tls_configs(open_port, tls=True, mtls=False), runtime_test_server(
-        open_port, protocol="grpc"
-    ):
-        # Construct Remote Module Config
-        connection_info = ConnectionInfo(
-            hostname="localhost",
-            port=open_port,
-            tls=ConnectionTlsInfo(enabled=True, insecure_verify=True),
-        )
-
-        with pytest.raises(ValueError):
-            remote_config = RemoteModuleConfig.load_from_module(
-                local_module_class,
-                connection_info,
-                "grpc",
-                MODEL_MESH_MODEL_ID_KEY,
-                sample_task_model_id,
-            )
-            # Set random module_id so tests don't conflict
-            remote_config.module_id = random_test_id()
-
-            remote_initializer = RemoteModelInitializer(Config({}), "test")
-            remote_initializer.init(remote_config)
+    # Train module
+    model_result = remote_model.train(
+        training_data=training_data, union_list=["str", "sequence"]
+    )
+    assert isinstance(model_result, ModuleBase)
 
 
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
 def test_remote_initializer_exception_handling(
-    sample_task_model_id, open_port, protocol
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_input,
 ):
     """Test to ensure RemoteModule Initializer works for insecure connections"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
-
     # Construct Remote Module Config
     connection_info = ConnectionInfo(hostname="localhost", port=80)
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        "bad_model_id",
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, "bad_model_id"
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
 
-    # Start runtime server even if its not used so all required DataBases are created
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct initializer and RemoteModule
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
+    # The runtime server is requested even though its not used so all required
+    # DataBases are created
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-        with pytest.raises(CaikitRuntimeException):
-            remote_model.run(SampleInputType(name="Test"), throw=False)
+    with pytest.raises(CaikitRuntimeException):
+        remote_model.run(sample_input, throw=False)
+
+    with pytest.raises(CaikitRuntimeException):
+        data_stream = remote_model.run_stream_out(sample_input, err_stream=False)
+        # This line forces the connection to be read which raises the error
+        list(data_stream)
 
+    # Only GRPC supports input streaming
+    if protocol == "grpc":
         with pytest.raises(CaikitRuntimeException):
-            data_stream = remote_model.run_stream_out(
-                SampleInputType(name="Test"), err_stream=False
+            remote_model.run_stream_in(
+                sample_inputs=DataStream.from_iterable([sample_input])
             )
-            # This line forces the connection to be read which raises the error
-            [item for item in data_stream]
 
-        # Only GRPC supports input streaming
-        if protocol == "grpc":
-            with pytest.raises(CaikitRuntimeException):
-                remote_model.run_stream_in(
-                    sample_inputs=DataStream.from_iterable(
-                        [SampleInputType(name="Test")]
-                    )
-                )
+
+def test_remote_initializer_http_unix_socket(base_remote_config, remote_initializer):
+    """Test to ensure RemoteModule Initializer raises when a unix socket target
+    is used with http"""
+    connection_info = ConnectionInfo(hostname="unix:///tmp/grpc.sock")
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, "http", "unused_model_id"
+    )
+
+    with pytest.raises(ValueError):
+        remote_initializer.init(remote_config)
 
 
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
-def test_remote_initializer_retry(sample_task_model_id, open_port, protocol):
+def test_remote_initializer_retry(
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_input,
+):
     """Test to ensure RemoteModule Initializer works with retries"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
-
     # Add custom retry options to ensure they're correctly applied
     retry_options = {}
     if protocol == "grpc":
@@ -493,125 +478,142 @@ def test_remote_initializer_retry(sample_task_model_id, open_port, protocol):
 
     # Construct Remote Module Config with 3 retries
     connection_info = ConnectionInfo(
-        hostname="localhost", port=open_port, retries=3, retry_options=retry_options
+        hostname="localhost",
+        port=shared_runtime_server.port,
+        retries=3,
+        retry_options=retry_options,
     )
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
 
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct initializer and RemoteModule
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-        # Run RemoteModule Request and ensure that even though 2 requests fail the 3rd succeeds and the result is returned
+    # Run RemoteModule Request and ensure that even though 2 requests fail the 3rd succeeds and the result is returned
+    model_result = remote_model.run(
+        sample_input,
+        request_id=random_test_id(),
+        throw_first_num_requests=2,
+    )
+    assert isinstance(model_result, SampleOutputType)
+    assert model_result.greeting == "Hello Test"
+
+    # Run RemoteModule and ensure an exception is still raised after the number of retries maxes out
+    with pytest.raises(CaikitRuntimeException):
         model_result = remote_model.run(
-            SampleInputType(name="Test"),
+            sample_input,
             request_id=random_test_id(),
-            throw_first_num_requests=2,
+            throw_first_num_requests=5,
         )
-        assert isinstance(model_result, SampleOutputType)
-        assert model_result.greeting == "Hello Test"
-
-        # Run RemoteModule and ensure an exception is still raised after the number of retries maxes out
-        with pytest.raises(CaikitRuntimeException):
-            model_result = remote_model.run(
-                SampleInputType(name="Test"),
-                request_id=random_test_id(),
-                throw_first_num_requests=5,
-            )
 
 
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
 def test_remote_initializer_always_new_channel(
-    sample_task_model_id, open_port, protocol
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_input,
 ):
     """Test to ensure RemoteModule Initializer zero max connection age always creates
     a new channel"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
-
     # Construct Remote Module Config with a max session age of 0
     connection_info = ConnectionInfo(
-        hostname="localhost", port=open_port, max_session_age=0
+        hostname="localhost", port=shared_runtime_server.port, max_session_age=0
     )
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
 
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct initializer and RemoteModule
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-        # Run RemoteModule Request and ensure that the remote model does not have a saved channel
-        model_result = remote_model.run(
-            SampleInputType(name="Test"),
-            request_id=random_test_id(),
-        )
-        assert model_result.greeting == "Hello Test"
-        assert not remote_model._conn_channel
+    # Run RemoteModule Request and ensure that the remote model does not have a saved channel
+    model_result = remote_model.run(
+        sample_input,
+        request_id=random_test_id(),
+    )
+    assert model_result.greeting == "Hello Test"
+    assert not remote_model._conn_channel
 
 
 @pytest.mark.parametrize("protocol", ["grpc", "http"])
-def test_remote_initializer_time_new_channel(sample_task_model_id, open_port, protocol):
+def test_remote_initializer_time_new_channel(
+    sample_task_model_id,
+    base_remote_config,
+    remote_initializer,
+    shared_runtime_server,
+    protocol,
+    sample_input,
+):
     """Test to ensure RemoteModule Initializer max session age correctly takes affect"""
-    local_module_class = (
-        ModelManager.get_instance().retrieve_model(sample_task_model_id).__class__
-    )
-
     # Construct Remote Module Config with a small max session age
     connection_info = ConnectionInfo(
-        hostname="localhost", port=open_port, max_session_age=0.5
+        hostname="localhost", port=shared_runtime_server.port, max_session_age=0.5
     )
-    remote_config = RemoteModuleConfig.load_from_module(
-        local_module_class,
-        connection_info,
-        protocol,
-        MODEL_MESH_MODEL_ID_KEY,
-        sample_task_model_id,
+    remote_config = make_remote_config(
+        base_remote_config, connection_info, protocol, sample_task_model_id
     )
-    # Set random module_id so tests don't conflict
-    remote_config.module_id = random_test_id()
 
-    with runtime_test_server(open_port, protocol=protocol):
-        # Construct initializer and RemoteModule
-        remote_initializer = RemoteModelInitializer(Config({}), "test")
-        remote_model = remote_initializer.init(remote_config)
-        assert isinstance(remote_model, ModuleBase)
+    # Construct RemoteModule
+    remote_model = remote_initializer.init(remote_config)
+    assert isinstance(remote_model, ModuleBase)
 
-        # Run RemoteModule Request twice to ensure the channel is retained
+    # Run RemoteModule Request twice to ensure the channel is retained
+    remote_model.run(
+        sample_input,
+        request_id=random_test_id(),
+    )
+    first_channel = remote_model._conn_channel
+    remote_model.run(sample_input, request_id=random_test_id())
+    assert first_channel == remote_model._conn_channel
+
+    # Retrun RemoteModule Request with mocked date to ensure that a new channel was generated
+    tomorrow_time = datetime.now() + timedelta(days=1)
+    with mock.patch(
+        "caikit.runtime.client.remote_module_base.datetime",
+        mock.Mock(now=lambda: tomorrow_time),
+    ):
         remote_model.run(
-            SampleInputType(name="Test"),
+            sample_input,
             request_id=random_test_id(),
         )
-        first_channel = remote_model._conn_channel
-        remote_model.run(SampleInputType(name="Test"), request_id=random_test_id())
-        assert first_channel == remote_model._conn_channel
-
-        # Retrun RemoteModule Request with mocked date to ensure that a new channel was generated
-        tomorrow_time = datetime.now() + timedelta(days=1)
-        with mock.patch(
-            "caikit.runtime.client.remote_module_base.datetime",
-            mock.Mock(now=lambda: tomorrow_time),
-        ):
-            remote_model.run(
-                SampleInputType(name="Test"),
-                request_id=random_test_id(),
-            )
-            assert first_channel != remote_model._conn_channel
+        assert first_channel != remote_model._conn_channel
+
+
+def test_remote_initializer_parallel_init(
+    sample_task_model_id, base_remote_config, remote_initializer
+):
+    """Test to ensure concurrent inits of the same module_id construct a single
+    module class instead of raising a module_id conflict"""
+    # Channels are created lazily so no server is needed
+    connection_info = ConnectionInfo(hostname="localhost", port=get_open_port())
+    remote_configs = [
+        make_remote_config(
+            base_remote_config, connection_info, protocol, sample_task_model_id
+        )
+        for protocol in ["grpc", "http"]
+    ]
+    remote_configs[1].module_id = remote_configs[0].module_id
+
+    # Slow down class construction so both inits overlap
+    construct_module_class = remote_initializer.construct_module_class
+
+    def slow_construct_module_class(*args, **kwargs):
+        time.sleep(0.1)
+        return construct_module_class(*args, **kwargs)
+
+    with mock.patch.object(
+        remote_initializer,
+        "construct_module_class",
+        side_effect=slow_construct_module_class,
+    ) as mock_construct, ThreadPoolExecutor(max_workers=2) as executor:
+        remote_models = list(executor.map(remote_initializer.init, remote_configs))
+
+    assert mock_construct.call_count == 1
+    assert remote_models[0] is not remote_models[1]
+    assert type(remote_models[0]) is type(remote_models[1])
@@ -0,0 +1,61 @@
+# Copyright The Caikit Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the remote client connection utils
+"""
+
+# Standard
+from unittest import mock
+
+# Third Party
+import pytest
+
+# Local
+from caikit.interfaces.common.data_model import ConnectionInfo, ConnectionTlsInfo
+from caikit.runtime.client.utils import construct_grpc_channel, get_grpc_target
+
+## Tests #######################################################################
+
+
+def test_construct_grpc_channel_options():
+    """Make sure the provided options are passed to the channel without
+    modifying the caller's list"""
+    options = [("grpc.keepalive_time_ms", 60000)]
+    with mock.patch("grpc.insecure_channel") as mock_channel:
+        construct_grpc_channel(
+            "localhost:8085",
+            options,
+            tls=ConnectionTlsInfo(),
+            retries=3,
+            retry_options={},
+        )
+    channel_options = dict(mock_channel.call_args.kwargs["options"])
+    assert channel_options["grpc.keepalive_time_ms"] == 60000
+    assert channel_options["grpc.enable_retries"] == 1
+    assert options == [("grpc.keepalive_time_ms", 60000)]
+
+
+@pytest.mark.parametrize(
+    ["hostname", "port", "expected_target"],
+    [
+        ("localhost", 8085, "localhost:8085"),
+        ("unix:///tmp/grpc.sock", 8085, "unix:///tmp/grpc.sock"),
+        ("unix:grpc.sock", None, "unix:grpc.sock"),
+        ("unix-abstract:grpc", 8085, "unix-abstract:grpc"),
+    ],
+)
+def test_get_grpc_target(hostname, port, expected_target):
+    """Make sure the port is only added for non unix socket targets"""
+    connection = ConnectionInfo(hostname=hostname, port=port)
+    assert get_grpc_target(connection) == expected_target
@@ -4,8 +4,8 @@ This sets up global test configs when pytest starts
 
 # Standard
 from contextlib import closing, contextmanager
-from functools import partial
-from typing import Dict, Iterable, List, Optional, Type, Union
+from functools import lru_cache, partial
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
 from unittest import mock
 import os
 import shlex
@@ -254,6 +254,54 @@ def runtime_test_server(*args, protocol: str = "grpc", **kwargs):
             yield server
 
 
+@contextmanager
+def runtime_tls_test_server(
+    port: int,
+    protocol: str = "grpc",
+    mtls: bool = False,
+    **tls_kwargs,
+) -> Iterable[
+    Tuple[aconfig.Config, Union[RuntimeGRPCServer, http_server.RuntimeHTTPServer]]
+]:
+    """Helper to generate tls configs and boot either server with them. Yields
+    the generated config overrides along with the server.
+    """
+    with generate_tls_configs(
+        port, tls=True, mtls=mtls, **tls_kwargs
+    ) as config_overrides, runtime_test_server(
+        port,
+        protocol=protocol,
+        tls_config_override=config_overrides if protocol == "http" else None,
+    ) as server:
+        yield config_overrides, server
+
+
+@pytest.fixture(scope="module")
+def shared_runtime_servers() -> Dict[
+    str, Union[RuntimeGRPCServer, http_server.RuntimeHTTPServer]
+]:
+    """Module scoped grpc and http runtime servers running side by side so that
+    tests for both protocols in a module share a single pair of servers. The
+    grpc server also listens on a unix socket whose target is available as
+    unix_socket_target
+    """
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "grpc.sock")
+        with temp_config(
+            {"runtime": {"grpc": {"unix_socket_path": socket_path}}}, "merge"
+        ), runtime_grpc_test_server(get_open_port()) as grpc_server:
+            _check_server_readiness(grpc_server)
+            grpc_server.unix_socket_target = f"unix://{socket_path}"
+            with runtime_http_test_server(get_open_port()) as http_runtime_server:
+                yield {"grpc": grpc_server, "http": http_runtime_server}
+
+
+@pytest.fixture
+def shared_runtime_server(shared_runtime_servers, protocol):
+    """The shared runtime server for the parametrized protocol"""
+    return shared_runtime_servers[protocol]
+
+
 @pytest.fixture(scope="session")
 def inference_stub(sample_inference_service, runtime_grpc_server) -> Type:
     inference_stub = sample_inference_service.stub_class(
@@ -569,12 +617,15 @@ def generate_tls_configs(
         use_in_test = config_overrides.setdefault("use_in_test", {})
         use_in_test["workdir"] = workdir
         if mtls or tls:
-            ca_key = tls_test_tools.generate_key()[0]
-            ca_cert = tls_test_tools.generate_ca_cert(ca_key)
-            server_key, server_cert = tls_test_tools.generate_derived_key_cert_pair(
-                ca_key=ca_key,
-                san_list=server_sans,
+            key_material = _generate_tls_key_material(
+                mtls=mtls,
+                separate_client_ca=separate_client_ca,
+                server_sans=tuple(server_sans) if server_sans is not None else None,
+                client_sans=tuple(client_sans) if client_sans is not None else None,
             )
+            ca_cert = key_material["ca_cert"]
+            server_key = key_material["server_key"]
+            server_cert = key_material["server_cert"]
             server_certfile, server_keyfile = save_key_cert_pair(
                 "server", workdir, server_key, server_cert
             )
@@ -607,16 +658,7 @@ def generate_tls_configs(
             use_in_test["bad_ca_cert"] = bad_ca_file
 
             if mtls:
-                if separate_client_ca:
-                    subject_kwargs = {"common_name": "my.client"}
-                    client_ca_key = tls_test_tools.generate_key()[0]
-                    client_ca_cert = tls_test_tools.generate_ca_cert(
-                        client_ca_key, **subject_kwargs
-                    )
-                else:
-                    subject_kwargs = {}
-                    client_ca_key = ca_key
-                    client_ca_cert = ca_cert
+                client_ca_cert = key_material["client_ca_cert"]
 
                 # If inlining the client CA
                 if inline:
@@ -631,11 +673,8 @@ def generate_tls_configs(
                 client_certfile, client_keyfile = save_key_cert_pair(
                     "client",
                     workdir,
-                    *tls_test_tools.generate_derived_key_cert_pair(
-                        ca_key=client_ca_key,
-                        san_list=client_sans,
-                        **subject_kwargs,
-                    ),
+                    key_material["client_key"],
+                    key_material["client_cert"],
                 )
                 # need to save the client cert and key in config_overrides so the mtls test below can access it
                 use_in_test["client_cert"] = client_certfile
@@ -652,6 +691,54 @@ def generate_tls_configs(
             yield aconfig.Config(config_overrides)
 
 
+@lru_cache(maxsize=None)
+def _generate_tls_key_material(
+    mtls: bool,
+    separate_client_ca: bool,
+    server_sans: Optional[Tuple[str, ...]],
+    client_sans: Optional[Tuple[str, ...]],
+) -> Dict[str, str]:
+    """Generate the PEM encoded CA, server and (for mtls) client keys and certs.
+    Key generation is by far the slowest part of setting up TLS, so the
+    material is cached for the whole session and only written to disk per
+    generate_tls_configs call.
+    """
+    ca_key = tls_test_tools.generate_key()[0]
+    ca_cert = tls_test_tools.generate_ca_cert(ca_key)
+    server_key, server_cert = tls_test_tools.generate_derived_key_cert_pair(
+        ca_key=ca_key,
+        san_list=list(server_sans) if server_sans is not None else None,
+    )
+    key_material = {
+        "ca_cert": ca_cert,
+        "server_key": server_key,
+        "server_cert": server_cert,
+    }
+
+    if mtls:
+        if separate_client_ca:
+            subject_kwargs = {"common_name": "my.client"}
+            client_ca_key = tls_test_tools.generate_key()[0]
+            client_ca_cert = tls_test_tools.generate_ca_cert(
+                client_ca_key, **subject_kwargs
+            )
+        else:
+            subject_kwargs = {}
+            client_ca_key = ca_key
+            client_ca_cert = ca_cert
+
+        client_key, client_cert = tls_test_tools.generate_derived_key_cert_pair(
+            ca_key=client_ca_key,
+            san_list=list(client_sans) if client_sans is not None else None,
+            **subject_kwargs,
+        )
+        key_material["client_ca_cert"] = client_ca_cert
+        key_material["client_key"] = client_key
+        key_material["client_cert"] = client_cert
+
+    return key_material
+
+
 def save_key_cert_pair(prefix, workdir, key=None, cert=None):
     crtfile, keyfile = None, None
     if key is not None: